@@ -1,190 +1,269 @@
 import tkinter as tk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from matplotlib.figure import Figure
 import numpy as np
 from datetime import datetime, timedelta
-from PIL import Image, ImageTk
 import math
+import threading
+import time
+from collections import deque
+from types import MappingProxyType
+from telemetry_kernels import warm_up
 from telemetry_simulator import TelemetrySimulator
 
+# Colores del tema (de sólo lectura)
+THEME = MappingProxyType({
+    'bg_dark': '#1a1f2e',
+    'bg_panel': '#243447',
+    'bg_card': '#2a3f5f',
+    'text_white': '#ffffff',
+    'text_gray': '#8b9bb8',
+    'blue_accent': '#4a9eff',
+    'orange_accent': '#ff8c42',
+    'green_accent': '#4ade80',
+})
+
+# Combinaciones de colores que repiten la mayoría de los widgets
+DARK_STYLE = {'bg': THEME['bg_dark']}
+PANEL_STYLE = {'bg': THEME['bg_panel']}
+PANEL_TEXT_STYLE = {'bg': THEME['bg_panel'], 'fg': THEME['text_white']}
+PANEL_MUTED_STYLE = {'bg': THEME['bg_panel'], 'fg': THEME['text_gray']}
+
+# Segundos simulados entre paquetes (ritmo del hilo productor)
+SAMPLE_PERIOD = 0.5
+# Milisegundos entre ticks de la interfaz; más corto que SAMPLE_PERIOD para
+# mostrar cada paquete poco después de que llegue
+TICK_MS = 100
+# Las gráficas se repintan uno de cada PLOT_EVERY paquetes; los sensores
+# numéricos se actualizan con todos
+PLOT_EVERY = 3
+
+# Márgenes en píxeles del área de trazado de cada gráfica
+# (izquierda, arriba, derecha, abajo); abajo quedan las etiquetas del eje X
+GRAPH_PAD = (8, 6, 8, 20)
+
+# Filas visibles del log y mensajes que se conservan en memoria
+LOG_ROWS = 50
+LOG_HISTORY = 1000
+
+
+def _blend(color, alpha, background=THEME['bg_panel']):
+    """Color opaco equivalente a pintar ``color`` con ``alpha`` sobre el fondo.
+
+    El lienzo de Tk no tiene transparencia, así que los rellenos y la
+    cuadrícula de las gráficas usan el color ya mezclado.
+    """
+    fg = [int(color[i:i + 2], 16) for i in (1, 3, 5)]
+    bg = [int(background[i:i + 2], 16) for i in (1, 3, 5)]
+    return '#' + ''.join(f"{round(b + (f - b) * alpha):02x}" for f, b in zip(fg, bg))
+
+
 class CanSatMissionControl:
     def __init__(self, root):
         self.root = root
         self.root.title("CANSAT MISSION CONTROL")
         self.root.geometry("1400x900")
-        self.root.configure(bg='#1a1f2e')
-        
-        # Colores del tema
-        self.bg_dark = '#1a1f2e'
-        self.bg_panel = '#243447'
-        self.bg_card = '#2a3f5f'
-        self.text_white = '#ffffff'
-        self.text_gray = '#8b9bb8'
-        self.blue_accent = '#4a9eff'
-        self.orange_accent = '#ff8c42'
-        self.green_accent = '#4ade80'
+        self.root.configure(**DARK_STYLE)
         
         # Control de misión
         self.mission_running = False
         self.mission_start_time = None
         self.elapsed_seconds = 0
+        # id del ``after`` pendiente del bucle de telemetría, instante
+        # (``time.monotonic``) en que toca el siguiente tick y último segundo
+        # mostrado en el timer
+        self._tick_id = None
+        self._next_tick = 0.0
+        self._timer_seconds = -1
+        
+        # Hilo productor de telemetría: deja los paquetes en una cola acotada
+        # (append/popleft de deque son atómicos) y la interfaz toma el último
+        self._sample_q = deque(maxlen=4)
+        self._sampler_thread = None
+        self._sampler_stop = None
         
         # Variables para datos en tiempo real
-        # Inicialmente no hay datos; todo empieza en cero.
-        self.pressure_value = tk.DoubleVar(value=0.0)
+        # Inicialmente no hay datos; todo empieza en cero. Son atributos
+        # normales: las etiquetas se actualizan directamente en cada paquete.
+        self.pressure = 0.0
         # simulador externo que genera telemetría aleatoria
         self.simulator = TelemetrySimulator()
         # Aquí va la entrada de TEMPERATURA AMBIENTAL (°C)
-        self.temperature_value = tk.DoubleVar(value=0.0)
+        self.temperature = 0.0
         # Aquí va la entrada de ALTITUD (metros sobre el nivel del mar)
-        self.altitude_value = tk.DoubleVar(value=0.0)
+        self.altitude = 0.0
         # Aquí va la entrada de TASA DE CAMBIO DE ALTITUD (m/s)
-        self.altitude_rate = tk.DoubleVar(value=0.0)
+        self.altitude_rate = 0.0
         # Aquí va la entrada de LATENCIA DE SEÑAL (milisegundos)
-        self.signal_latency = tk.DoubleVar(value=0.0)
+        self.signal_latency = 0.0
         
         # Datos para gráficas
         # Historicos iniciales vacíos para evitar que la línea se dibuje antes
         # de que llegue cualquier valor.
-        self.velocity_time = np.linspace(-120, 0, 100)  # Últimos 120 segundos
-        self.velocity_data = np.zeros_like(self.velocity_time)
+        # float32 como en el simulador: la mitad de bytes por cuadro.
+        self.velocity_time = np.linspace(-120, 0, 100, dtype=np.float32)  # Últimos 120 segundos
+        self.velocity_data = np.zeros(100, dtype=np.float32)
         # Gráfica de G-force también arranca en cero
-        self.gforce_time = np.linspace(-1.5, 4.0, 100)
-        self.gforce_data = np.zeros_like(self.gforce_time)
+        # eje relativo en segundos: una muestra cada SAMPLE_PERIOD, T-0s es
+        # la más reciente
+        self.gforce_time = np.arange(-99, 1, dtype=np.float32) * SAMPLE_PERIOD
+        self.gforce_data = np.zeros(100, dtype=np.float32)
+        # Los ejes X no cambian nunca: las gráficas sólo actualizan Y
+        self.velocity_time.flags.writeable = False
+        self.gforce_time.flags.writeable = False
+        
+        # paquetes que faltan para volver a repintar las gráficas
+        self._plot_skip = 0
         
         # Referencias a widgets que se actualizarán
-        self.pressure_label = None
-        self.temp_label = None
         self.altitude_label = None
         self.altitude_rate_label = None
         self.latency_label = None
-        
-        # Crear interfaz
+        # signo mostrado en la tasa de altitud (la etiqueta arranca en verde)
+        self._rate_rising = True
+        
+        # Formateadores precompilados para las etiquetas que cambian en cada
+        # paquete (evitan reinterpretar el f-string en cada llamada)
+        self._fmt0 = "{:.0f}".format
+        self._fmt1 = "{:.1f}".format
+        self._fmt_altitude = "{:,.1f}".format
+        self._fmt_rate = "{:+.1f} m/s".format
+        
+        # Tabla de ``extent`` para los arcos de los medidores (un paso por
+        # grado: menos no se ve) y último paso dibujado en cada uno, para no
+        # repetir itemconfigure. 360° exactos no se dibujan, se topa en 359.9.
+        self._extent_lut = tuple(-min(deg, 359.9) for deg in range(361))
+        self._last_extent_idx = {'pressure': -1, 'temperature': -1}
+        
+        # Crear interfaz: cabecera y pie se crean de inmediato; el contenido
+        # pesado se construye cuando Tk queda ocioso, así la ventana se pinta
+        # sin esperar a las gráficas.
         self.create_header()
-        self.create_main_content()
         self.create_footer()
-
-        # iniciar la simulación automáticamente para demostración
-        self.toggle_mission()
+        self.root.after_idle(self.create_main_content)
         
     def create_header(self):
         """Crear barra superior con título y controles"""
-        header = tk.Frame(self.root, bg=self.bg_dark, height=70)
+        header = tk.Frame(self.root, bg=THEME['bg_dark'], height=70)
         header.pack(fill=tk.X, padx=20, pady=(10, 0))
         header.pack_propagate(False)
         
         # Logo y título
-        logo_frame = tk.Frame(header, bg=self.bg_dark)
+        logo_frame = tk.Frame(header, **DARK_STYLE)
         logo_frame.pack(side=tk.LEFT)
         
         # Icono de cohete (simulado con texto)
         rocket_label = tk.Label(logo_frame, text="🚀", font=('Arial', 30), 
-                               bg=self.bg_dark, fg=self.blue_accent)
+                               bg=THEME['bg_dark'], fg=THEME['blue_accent'])
         rocket_label.pack(side=tk.LEFT, padx=(0, 15))
         
-        title_frame = tk.Frame(logo_frame, bg=self.bg_dark)
+        title_frame = tk.Frame(logo_frame, **DARK_STYLE)
         title_frame.pack(side=tk.LEFT)
         
         title = tk.Label(title_frame, text="CANSAT ", font=('Arial', 20, 'bold'), 
-                        bg=self.bg_dark, fg=self.text_white)
+                        bg=THEME['bg_dark'], fg=THEME['text_white'])
         title.pack(side=tk.LEFT)
         
         title2 = tk.Label(title_frame, text="MISSION CONTROL", font=('Arial', 20, 'bold'), 
-                         bg=self.bg_dark, fg=self.blue_accent)
+                         bg=THEME['bg_dark'], fg=THEME['blue_accent'])
         title2.pack(side=tk.LEFT)
         
         status = tk.Label(title_frame, text="● LIVE UPLINK ACTIVE", 
-                         font=('Arial', 9), bg=self.bg_dark, fg=self.green_accent)
+                         font=('Arial', 9), bg=THEME['bg_dark'], fg=THEME['green_accent'])
         status.pack(anchor='w')
         
         # Panel derecho - Timer y botón START
-        right_panel = tk.Frame(header, bg=self.bg_dark)
+        right_panel = tk.Frame(header, **DARK_STYLE)
         right_panel.pack(side=tk.RIGHT)
         
-        timer_frame = tk.Frame(right_panel, bg=self.bg_dark)
+        timer_frame = tk.Frame(right_panel, **DARK_STYLE)
         timer_frame.pack(side=tk.LEFT, padx=20)
         
         timer_label = tk.Label(timer_frame, text="MISSION TIMER", 
-                              font=('Arial', 9), bg=self.bg_dark, fg=self.text_gray)
+                              font=('Arial', 9), bg=THEME['bg_dark'], fg=THEME['text_gray'])
         timer_label.pack()
         
         # Aquí se muestra el TIEMPO DE MISIÓN (T+ HH:MM:SS)
         self.timer_display = tk.Label(timer_frame, text="T+ 00:00:00", 
                                      font=('Arial', 18, 'bold'), 
-                                     bg=self.bg_dark, fg=self.text_white)
+                                     bg=THEME['bg_dark'], fg=THEME['text_white'])
         self.timer_display.pack()
         
-        # Botón START/STOP
+        # Botón START/STOP (se habilita cuando termina de crearse la interfaz)
         self.start_btn = tk.Button(right_panel, text="▶ START", 
                                font=('Arial', 11, 'bold'),
-                               bg=self.green_accent, fg=self.text_white,
+                               bg=THEME['green_accent'], fg=THEME['text_white'],
                                relief=tk.FLAT, padx=20, pady=8,
-                               cursor='hand2',
+                               cursor='hand2', state=tk.DISABLED,
                                command=self.toggle_mission)
         self.start_btn.pack(side=tk.LEFT)
         
     def create_main_content(self):
         """Crear contenido principal"""
-        main = tk.Frame(self.root, bg=self.bg_dark)
+        main = tk.Frame(self.root, **DARK_STYLE)
         main.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
         
         # Frame izquierdo (tarjetas y gráficas)
-        left_frame = tk.Frame(main, bg=self.bg_dark)
+        left_frame = tk.Frame(main, **DARK_STYLE)
         left_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Fila superior - Tarjetas de sensores
-        top_row = tk.Frame(left_frame, bg=self.bg_dark)
+        top_row = tk.Frame(left_frame, **DARK_STYLE)
         top_row.pack(fill=tk.X, pady=(0, 15))
         
         # Tarjeta de presión atmosférica
         self.create_circular_gauge(top_row, "ATMOSPHERIC", "0", "kPa", 
-                                   "Pressure", self.blue_accent, 0.0, 'pressure').pack(side=tk.LEFT, padx=(0, 15))
+                                   "Pressure", THEME['blue_accent'], 0.0, 'pressure').pack(side=tk.LEFT, padx=(0, 15))
         
         # Tarjeta de temperatura
         self.create_circular_gauge(top_row, "ENVIRONMENT", "0", "°C", 
-                                   "Temperature", self.orange_accent, 0.0, 'temperature').pack(side=tk.LEFT, padx=(0, 15))
+                                   "Temperature", THEME['orange_accent'], 0.0, 'temperature').pack(side=tk.LEFT, padx=(0, 15))
         
         # Tarjeta de altitud y latencia
         self.create_altitude_card(top_row).pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # Fila media - Gráficas
-        middle_row = tk.Frame(left_frame, bg=self.bg_dark)
+        middle_row = tk.Frame(left_frame, **DARK_STYLE)
         middle_row.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
-        # Gráfica de distribución de velocidad
-        self.create_velocity_graph(middle_row).pack(side=tk.LEFT, fill=tk.BOTH, 
-                                                    expand=True, padx=(0, 15))
-        
-        # Gráfica de aceleración G-Force
-        self.create_gforce_graph(middle_row).pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
         # Fila inferior - Cámaras
-        bottom_row = tk.Frame(left_frame, bg=self.bg_dark)
+        bottom_row = tk.Frame(left_frame, **DARK_STYLE)
         bottom_row.pack(fill=tk.BOTH, expand=True)
         
-        self.create_camera_panel(bottom_row).pack(fill=tk.BOTH, expand=True)
-        
         # Panel derecho - Log y controles
-        right_frame = tk.Frame(main, bg=self.bg_dark, width=350)
+        right_frame = tk.Frame(main, bg=THEME['bg_dark'], width=350)
         right_frame.pack(side=tk.RIGHT, fill=tk.BOTH, padx=(15, 0))
         right_frame.pack_propagate(False)
         
         self.create_log_panel(right_frame)
         
+        # Gráficas y cámaras en otra pasada ociosa, para que Tk pinte antes
+        # las tarjetas y el log
+        self.root.after_idle(self._create_deferred_content, middle_row, bottom_row)
+        
+    def _create_deferred_content(self, middle_row, bottom_row):
+        """Crear gráficas y cámaras (lo más pesado) y arrancar la misión"""
+        # Gráficas de distribución de velocidad y aceleración G-Force
+        self.create_graphs_row(middle_row).pack(fill=tk.BOTH, expand=True)
+        
+        self.create_camera_panel(bottom_row).pack(fill=tk.BOTH, expand=True)
+        
+        # la interfaz ya está completa: habilitar START e iniciar la
+        # simulación automáticamente para demostración
+        self.start_btn.config(state=tk.NORMAL)
+        self.toggle_mission()
+        
     def create_circular_gauge(self, parent, label_top, value, unit, label_bottom, color, fill_percent, gauge_type):
         """Crear medidor circular (presión/temperatura)"""
-        card = tk.Frame(parent, bg=self.bg_panel, width=210, height=180)
+        card = tk.Frame(parent, bg=THEME['bg_panel'], width=210, height=180)
         card.pack_propagate(False)
         
         # Etiqueta superior
         top_label = tk.Label(card, text=label_top, font=('Arial', 9, 'bold'), 
-                            bg=self.bg_panel, fg=color)
+                            bg=THEME['bg_panel'], fg=color)
         top_label.pack(pady=(15, 10))
         
         # Canvas para círculo
-        canvas = tk.Canvas(card, width=120, height=120, bg=self.bg_panel, 
+        canvas = tk.Canvas(card, width=120, height=120, bg=THEME['bg_panel'], 
                           highlightthickness=0)
         canvas.pack()
         
@@ -194,304 +273,336 @@ class CanSatMissionControl:
                  outline='#3a4f6f', width=arc_width, style=tk.ARC, tags='bg_arc')
         
         # Círculo de progreso (aquí se actualiza según el VALOR DEL SENSOR)
+        # Se crea una sola vez; las actualizaciones sólo cambian su ``extent``
         extent = 359.9 * fill_percent
-        canvas.create_arc(10, 10, 110, 110, start=90, extent=-extent, 
+        arc_id = canvas.create_arc(10, 10, 110, 110, start=90, extent=-extent, 
                  outline=color, width=arc_width, style=tk.ARC, tags='progress_arc')
         
-        # Valor central (mover un poco hacia abajo y reducir tamaño de fuente)
-        value_label = tk.Label(canvas, text=value, font=('Arial', 24, 'bold'), 
-                      bg=self.bg_panel, fg=self.text_white)
-        value_label.place(relx=0.5, rely=0.56, anchor='center')
-
-        # Unidad (mover hacia abajo para evitar solapamiento)
-        unit_label = tk.Label(canvas, text=unit, font=('Arial', 10), 
-                     bg=self.bg_panel, fg=self.text_gray)
-        unit_label.place(relx=0.5, rely=0.78, anchor='center')
-
-        # Ajustes específicos por tipo de medidor para evitar solapamiento
+        # Valor central y unidad como textos del mismo canvas: cada paquete
+        # actualiza un solo widget. La presión usa un número más pequeño para
+        # caber dentro del arco; otros (ej. temperatura) usan el tamaño normal.
         if gauge_type == 'pressure':
-            # Presión atmosférica: número más pequeño para caber dentro del arco
-            value_label.config(font=('Arial', 20, 'bold'))
-            value_label.place_configure(relx=0.5, rely=0.56)
-            unit_label.config(font=('Arial', 9))
-            unit_label.place_configure(relx=0.5, rely=0.80)
+            value_font, unit_font, unit_y = ('Arial', 20, 'bold'), ('Arial', 9), 96
         else:
-            # Otros (ej. temperatura) mantienen el tamaño por defecto
-            value_label.config(font=('Arial', 24, 'bold'))
-            value_label.place_configure(relx=0.5, rely=0.56)
-            unit_label.config(font=('Arial', 10))
-            unit_label.place_configure(relx=0.5, rely=0.78)
+            value_font, unit_font, unit_y = ('Arial', 24, 'bold'), ('Arial', 10), 94
+        value_id = canvas.create_text(60, 67, text=value, font=value_font,
+                                      fill=THEME['text_white'])
+        canvas.create_text(60, unit_y, text=unit, font=unit_font,
+                           fill=THEME['text_gray'])
         
         # Etiqueta inferior
         bottom_label = tk.Label(card, text=label_bottom, font=('Arial', 11), 
-                               bg=self.bg_panel, fg=self.text_white)
+                               **PANEL_TEXT_STYLE)
         bottom_label.pack(pady=(5, 10))
         
         # Guardar referencias para actualización
         if gauge_type == 'pressure':
-            self.pressure_label = value_label
             self.pressure_canvas = canvas
-            self.pressure_color = color
+            self.pressure_value_id = value_id
+            self.pressure_arc_id = arc_id
         elif gauge_type == 'temperature':
-            self.temp_label = value_label
             self.temp_canvas = canvas
-            self.temp_color = color
+            self.temp_value_id = value_id
+            self.temp_arc_id = arc_id
         
         return card
         
+    def _set_gauge_fill(self, gauge_type, canvas, arc_id, fill):
+        """Mover el arco de un medidor a ``fill`` (0 a 1).
+
+        El ``extent`` sale de una tabla precalculada de grados enteros y el
+        arco sólo se toca si el grado cambió desde el último paquete.
+        """
+        idx = int(max(0, min(1, fill)) * 360)
+        if idx != self._last_extent_idx[gauge_type]:
+            self._last_extent_idx[gauge_type] = idx
+            canvas.itemconfigure(arc_id, extent=self._extent_lut[idx])
+        
     def create_altitude_card(self, parent):
         """Crear tarjeta de altitud y latencia de señal"""
-        card = tk.Frame(parent, bg=self.bg_panel)
+        card = tk.Frame(parent, **PANEL_STYLE)
         
         # Contenedor interno
-        content = tk.Frame(card, bg=self.bg_panel)
+        content = tk.Frame(card, **PANEL_STYLE)
         content.pack(fill=tk.BOTH, expand=True, padx=30, pady=20)
         
         # Sección izquierda - Altitud
-        left_section = tk.Frame(content, bg=self.bg_panel)
+        left_section = tk.Frame(content, **PANEL_STYLE)
         left_section.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         alt_label = tk.Label(left_section, text="ALTITUDE (ASL)", 
-                            font=('Arial', 9), bg=self.bg_panel, fg=self.text_gray)
+                            font=('Arial', 9), **PANEL_MUTED_STYLE)
         alt_label.pack(anchor='w')
         
         # Aquí se muestra el valor de ALTITUD actual
-        alt_value_frame = tk.Frame(left_section, bg=self.bg_panel)
+        alt_value_frame = tk.Frame(left_section, **PANEL_STYLE)
         alt_value_frame.pack(anchor='w', pady=(10, 5))
         
         self.altitude_label = tk.Label(alt_value_frame, text="0.0", 
                             font=('Arial', 36, 'bold'), 
-                            bg=self.bg_panel, fg=self.text_white)
+                            **PANEL_TEXT_STYLE)
         self.altitude_label.pack(side=tk.LEFT)
         
         alt_unit = tk.Label(alt_value_frame, text="m", 
                            font=('Arial', 18, 'bold'), 
-                           bg=self.bg_panel, fg=self.blue_accent)
+                           bg=THEME['bg_panel'], fg=THEME['blue_accent'])
         alt_unit.pack(side=tk.LEFT, padx=(5, 0), pady=(10, 0))
         
         # Tasa de cambio (aquí va la VELOCIDAD VERTICAL)
-        rate_frame = tk.Frame(left_section, bg=self.bg_panel)
+        rate_frame = tk.Frame(left_section, **PANEL_STYLE)
         rate_frame.pack(anchor='w')
         
         rate_icon = tk.Label(rate_frame, text="📈", font=('Arial', 12), 
-                            bg=self.bg_panel)
+                            **PANEL_STYLE)
         rate_icon.pack(side=tk.LEFT)
         
         self.altitude_rate_label = tk.Label(rate_frame, text="0.0 m/s", 
-                             font=('Arial', 11), bg=self.bg_panel, fg=self.green_accent)
+                             font=('Arial', 11), bg=THEME['bg_panel'], fg=THEME['green_accent'])
         self.altitude_rate_label.pack(side=tk.LEFT, padx=(5, 0))
         
         # Sección derecha - Latencia
-        right_section = tk.Frame(content, bg=self.bg_panel)
+        right_section = tk.Frame(content, **PANEL_STYLE)
         right_section.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=(30, 0))
         
         lat_label = tk.Label(right_section, text="SIGNAL LATENCY", 
-                            font=('Arial', 9), bg=self.bg_panel, fg=self.text_gray)
+                            font=('Arial', 9), **PANEL_MUTED_STYLE)
         lat_label.pack(anchor='w')
         
         # Aquí se muestra la LATENCIA DE SEÑAL actual
-        lat_value_frame = tk.Frame(right_section, bg=self.bg_panel)
+        lat_value_frame = tk.Frame(right_section, **PANEL_STYLE)
         lat_value_frame.pack(anchor='w', pady=(10, 5))
         
         self.latency_label = tk.Label(lat_value_frame, text="0", 
                             font=('Arial', 36, 'bold'), 
-                            bg=self.bg_panel, fg=self.text_white)
+                            **PANEL_TEXT_STYLE)
         self.latency_label.pack(side=tk.LEFT)
         
         lat_unit = tk.Label(lat_value_frame, text="ms", 
                            font=('Arial', 18, 'bold'), 
-                           bg=self.bg_panel, fg=self.blue_accent)
+                           bg=THEME['bg_panel'], fg=THEME['blue_accent'])
         lat_unit.pack(side=tk.LEFT, padx=(5, 0), pady=(10, 0))
         
         # Estado de rango
-        range_frame = tk.Frame(right_section, bg=self.bg_panel)
+        range_frame = tk.Frame(right_section, **PANEL_STYLE)
         range_frame.pack(anchor='w')
         
         range_icon = tk.Label(range_frame, text="📡", font=('Arial', 12), 
-                             bg=self.bg_panel)
+                             **PANEL_STYLE)
         range_icon.pack(side=tk.LEFT)
         
         range_label = tk.Label(range_frame, text="Optimal Range", 
-                              font=('Arial', 11), bg=self.bg_panel, fg=self.text_gray)
+                              font=('Arial', 11), **PANEL_MUTED_STYLE)
         range_label.pack(side=tk.LEFT, padx=(5, 0))
         
         return card
         
-    def create_velocity_graph(self, parent):
-        """Crear gráfica de distribución de velocidad"""
-        card = tk.Frame(parent, bg=self.bg_panel)
+    def create_graphs_row(self, parent):
+        """Crear las gráficas de velocidad y G-force.
+
+        Se dibujan directamente sobre un ``tk.Canvas`` por gráfica: la línea y
+        el área bajo la curva son dos items que cada paquete mueve con
+        ``coords``, sin rasterizar nada en Python.
+        """
+        card = tk.Frame(parent, **PANEL_STYLE)
         
-        # Encabezado
-        header = tk.Frame(card, bg=self.bg_panel)
+        # Encabezados (velocidad a la izquierda, G-force a la derecha)
+        header = tk.Frame(card, **PANEL_STYLE)
         header.pack(fill=tk.X, padx=20, pady=(15, 0))
         
-        title_frame = tk.Frame(header, bg=self.bg_panel)
-        title_frame.pack(side=tk.LEFT)
+        self.create_graph_header(header, "📊", "VELOCITY DISTRIBUTION",
+                                 THEME['blue_accent'], "120s").pack(
+            side=tk.LEFT, fill=tk.X, expand=True, padx=(0, 30))
+        self.create_graph_header(header, "📈", "G-FORCE ACCELERATION",
+                                 THEME['orange_accent'], "HISTORIC").pack(
+            side=tk.LEFT, fill=tk.X, expand=True)
         
-        icon = tk.Label(title_frame, text="📊", font=('Arial', 14), bg=self.bg_panel)
-        icon.pack(side=tk.LEFT)
-        
-        title = tk.Label(title_frame, text="VELOCITY DISTRIBUTION", 
-                        font=('Arial', 11, 'bold'), bg=self.bg_panel, fg=self.text_white)
-        title.pack(side=tk.LEFT, padx=(8, 0))
-        
-        # Botones de control
-        btn_frame = tk.Frame(header, bg=self.bg_panel)
-        btn_frame.pack(side=tk.RIGHT)
-        
-        live_btn = tk.Label(btn_frame, text="LIVE", font=('Arial', 9, 'bold'),
-                           bg=self.blue_accent, fg=self.text_white, 
-                           padx=12, pady=4)
-        live_btn.pack(side=tk.LEFT, padx=(0, 5))
-        
-        time_btn = tk.Label(btn_frame, text="120s", font=('Arial', 9),
-                           bg='#3a4f6f', fg=self.text_gray, 
-                           padx=12, pady=4)
-        time_btn.pack(side=tk.LEFT)
-        
-        # Gráfica con matplotlib en ALTA CALIDAD
-        fig = Figure(figsize=(5, 2.5), dpi=100, facecolor=self.bg_panel)
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(self.bg_panel)
+        plots = tk.Frame(card, **PANEL_STYLE)
+        plots.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
         
         # Aquí se grafican los DATOS DE VELOCIDAD en función del tiempo
         # Los datos vienen de self.velocity_data y self.velocity_time
-        self.velocity_line, = ax.plot(self.velocity_time, self.velocity_data, 
-                                      color=self.blue_accent, linewidth=2.5, 
-                                      antialiased=True)
-        ax.fill_between(self.velocity_time, self.velocity_data, 
-                        alpha=0.1, color=self.blue_accent)
-        
-        ax.set_xlim(-120, 0)
-        ax.set_ylim(0, 30)
-        ax.grid(True, alpha=0.1, color=self.text_gray)
-        
-        # Etiquetas de tiempo - Sin superposición
-        ax.set_xticks([-120, -60, 0])
-        ax.set_xticklabels(['T-120s', 'T-60s', 'T-0s'], color=self.text_gray, fontsize=8)
-        ax.set_yticks([])
-        
-        # Quitar bordes innecesarios
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.spines['bottom'].set_color(self.text_gray)
-        ax.spines['bottom'].set_alpha(0.3)
-        
-        # Ajustar márgenes para evitar superposición
-        fig.subplots_adjust(left=0.05, right=0.98, top=0.95, bottom=0.15)
-        
-        # Integrar en tkinter con alta calidad
-        canvas = FigureCanvasTkAgg(fig, card)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
-        
-        self.velocity_canvas = canvas
-        self.velocity_ax = ax
-        self.velocity_fig = fig
+        self.velocity_graph = self.create_line_graph(
+            plots, self.velocity_time, self.velocity_data, THEME['blue_accent'],
+            fill_alpha=0.1, ymax=30,
+            ticks=((-120, 'T-120s'), (-60, 'T-60s'), (0, 'T-0s')))
+        self.velocity_graph['canvas'].pack(side=tk.LEFT, fill=tk.BOTH, expand=True,
+                                           padx=(0, 20))
         
-        return card
-        
-    def create_gforce_graph(self, parent):
-        """Crear gráfica de aceleración G-Force"""
-        card = tk.Frame(parent, bg=self.bg_panel)
+        # Aquí se grafican los DATOS DE ACELERACIÓN G-FORCE
+        # Los datos vienen de self.gforce_data y self.gforce_time
+        # El eje X es relativo a la muestra más reciente, así que queda fijo.
+        self.gforce_graph = self.create_line_graph(
+            plots, self.gforce_time, self.gforce_data, THEME['orange_accent'],
+            fill_alpha=0.15, ymax=8,
+            ticks=((-49.5, 'T-49.5s'), (-25, 'T-25s'), (0, 'T-0s')), dash=(4, 4))
+        self.gforce_graph['canvas'].pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        # Encabezado
-        header = tk.Frame(card, bg=self.bg_panel)
-        header.pack(fill=tk.X, padx=20, pady=(15, 0))
+        return card
         
-        title_frame = tk.Frame(header, bg=self.bg_panel)
+    def create_line_graph(self, parent, x, y, color, fill_alpha, ymax, ticks, dash=None):
+        """Crear el lienzo de una gráfica de línea con área bajo la curva.
+
+        Devuelve un diccionario con el lienzo, los ids de sus items y la
+        escala actual. El eje X es fijo (``x`` no cambia); el rango Y va de 0
+        a ``ymax`` y sólo crece (ver ``_fit_ylim``).
+        """
+        canvas = tk.Canvas(parent, width=340, height=150, bg=THEME['bg_panel'],
+                           highlightthickness=0)
+        graph = {
+            'canvas': canvas,
+            'x': x,
+            'y': y,
+            'ymax': ymax,
+            'ymax_default': ymax,
+            'ticks': ticks,
+            'grid_style': {'fill': _blend(THEME['text_gray'], 0.1),
+                           **({'dash': dash} if dash else {})},
+            # coordenadas en píxeles: las filas de la línea y, al final, las
+            # dos esquinas que cierran el área sobre la línea base
+            'coords': np.zeros((len(x) + 2, 2)),
+            'fill': canvas.create_polygon(0, 0, 0, 0, 0, 0, outline='',
+                                          fill=_blend(color, fill_alpha)),
+            'line': canvas.create_line(0, 0, 0, 0, fill=color, width=2),
+        }
+        # La cuadrícula y las columnas X sólo cambian con el tamaño del lienzo
+        canvas.bind('<Configure>',
+                    lambda event: self._layout_graph(graph, event.width, event.height))
+        self._layout_graph(graph, 340, 150)
+        return graph
+        
+    def create_graph_header(self, parent, icon_text, title_text, color, mode_text):
+        """Crear encabezado de una gráfica (título y botones LIVE/modo)"""
+        header = tk.Frame(parent, **PANEL_STYLE)
+        
+        title_frame = tk.Frame(header, **PANEL_STYLE)
         title_frame.pack(side=tk.LEFT)
         
-        icon = tk.Label(title_frame, text="📈", font=('Arial', 14), bg=self.bg_panel)
+        icon = tk.Label(title_frame, text=icon_text, font=('Arial', 14), **PANEL_STYLE)
         icon.pack(side=tk.LEFT)
         
-        title = tk.Label(title_frame, text="G-FORCE ACCELERATION", 
-                        font=('Arial', 11, 'bold'), bg=self.bg_panel, fg=self.text_white)
+        title = tk.Label(title_frame, text=title_text, 
+                        font=('Arial', 11, 'bold'), **PANEL_TEXT_STYLE)
         title.pack(side=tk.LEFT, padx=(8, 0))
         
         # Botones de control
-        btn_frame = tk.Frame(header, bg=self.bg_panel)
+        btn_frame = tk.Frame(header, **PANEL_STYLE)
         btn_frame.pack(side=tk.RIGHT)
         
         live_btn = tk.Label(btn_frame, text="LIVE", font=('Arial', 9, 'bold'),
-                           bg=self.orange_accent, fg=self.text_white, 
+                           bg=color, fg=THEME['text_white'], 
                            padx=12, pady=4)
         live_btn.pack(side=tk.LEFT, padx=(0, 5))
         
-        historic_btn = tk.Label(btn_frame, text="HISTORIC", font=('Arial', 9),
-                               bg='#3a4f6f', fg=self.text_gray, 
-                               padx=12, pady=4)
-        historic_btn.pack(side=tk.LEFT)
-        
-        # Gráfica con matplotlib en ALTA CALIDAD
-        fig = Figure(figsize=(5, 2.5), dpi=100, facecolor=self.bg_panel)
-        ax = fig.add_subplot(111)
-        ax.set_facecolor(self.bg_panel)
-        
-        # Aquí se grafican los DATOS DE ACELERACIÓN G-FORCE
-        # Los datos vienen de self.gforce_data y self.gforce_time
-        self.gforce_line, = ax.plot(self.gforce_time, self.gforce_data, 
-                                    color=self.orange_accent, linewidth=2.5, 
-                                    antialiased=True)
-        ax.fill_between(self.gforce_time, self.gforce_data, 
-                        alpha=0.15, color=self.orange_accent)
-        
-        ax.set_xlim(-1.5, 4.0)
-        ax.set_ylim(0, 8)
-        ax.grid(True, alpha=0.1, color=self.text_gray, linestyle='--')
-        
-        # Etiquetas - Sin superposición
-        ax.set_xticks([-1.5, 0, 4.0])
-        ax.set_xticklabels(['-1.50', '0.00', '+4.00'], color=self.text_gray, fontsize=8)
-        ax.set_yticks([])
-        
-        # Quitar bordes innecesarios
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-        ax.spines['left'].set_visible(False)
-        ax.spines['bottom'].set_color(self.text_gray)
-        ax.spines['bottom'].set_alpha(0.3)
-        
-        # Ajustar márgenes para evitar superposición
-        fig.subplots_adjust(left=0.05, right=0.98, top=0.95, bottom=0.15)
-        
-        # Integrar en tkinter con alta calidad
-        canvas = FigureCanvasTkAgg(fig, card)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
-        
-        self.gforce_canvas = canvas
-        self.gforce_ax = ax
-        self.gforce_fig = fig
+        mode_btn = tk.Label(btn_frame, text=mode_text, font=('Arial', 9),
+                           bg='#3a4f6f', fg=THEME['text_gray'], 
+                           padx=12, pady=4)
+        mode_btn.pack(side=tk.LEFT)
         
-        return card
+        return header
         
+    def _layout_graph(self, graph, width, height):
+        """Recalcular la escala de una gráfica y redibujar su parte estática.
+
+        Las columnas X de cada muestra se convierten a píxeles una sola vez
+        aquí; cada paquete sólo recalcula las filas Y.
+        """
+        left, top, right, bottom = GRAPH_PAD
+        x = graph['x']
+        x0, x1 = float(x[0]), float(x[-1])
+        x_scale = max(width - left - right, 1) / (x1 - x0)
+        base = height - bottom
+        graph['base'] = base
+        graph['height'] = max(base - top, 1)
+        
+        coords = graph['coords']
+        coords[:-2, 0] = left + (x - x0) * x_scale
+        coords[-2] = (coords[-3, 0], base)
+        coords[-1] = (coords[0, 0], base)
+        
+        canvas = graph['canvas']
+        canvas.delete('static')
+        for value, text in graph['ticks']:
+            px = left + (value - x0) * x_scale
+            anchor = 'nw' if value == x0 else 'ne' if value == x1 else 'n'
+            canvas.create_line(px, top, px, base, tags='static', **graph['grid_style'])
+            canvas.create_text(px, base + 4, text=text, anchor=anchor,
+                               fill=THEME['text_gray'], font=('Arial', 8), tags='static')
+        canvas.create_line(left, base, width - right, base,
+                           fill=_blend(THEME['text_gray'], 0.3), tags='static')
+        # el área queda bajo la cuadrícula y la línea encima de todo
+        canvas.tag_lower(graph['fill'])
+        canvas.tag_raise(graph['line'])
+        self._draw_trace(graph, graph['y'])
+
+    def _draw_trace(self, graph, y):
+        """Mover la línea y el área de una gráfica a los valores ``y``."""
+        graph['y'] = y
+        coords = graph['coords']
+        coords[:-2, 1] = graph['base'] - y * (graph['height'] / graph['ymax'])
+        flat = coords.ravel().tolist()
+        canvas = graph['canvas']
+        canvas.coords(graph['line'], flat[:-4])
+        canvas.coords(graph['fill'], flat)
+
+    @staticmethod
+    def _fit_ylim(graph, y):
+        """Ampliar el rango Y sólo cuando los datos se salen de él.
+
+        No hay etiquetas ni cuadrícula en Y, así que basta con cambiar la
+        escala: el siguiente ``_draw_trace`` ya la usa.
+        """
+        peak = float(y.max())
+        if peak > graph['ymax']:
+            graph['ymax'] = math.ceil(peak * 1.25)
+
+    def _reset_graph(self, graph):
+        """Vaciar una gráfica y devolverle el rango Y con que se creó."""
+        graph['ymax'] = graph['ymax_default']
+        self._draw_trace(graph, np.zeros_like(graph['y']))
+
+    def _update_velocity_frame(self, data):
+        """Cargar un paquete en la gráfica de velocidad.
+
+        El eje X es fijo: sólo cambia Y.
+        """
+        self.velocity_data = data['velocity_data']
+        self._fit_ylim(self.velocity_graph, self.velocity_data)
+        self._draw_trace(self.velocity_graph, self.velocity_data)
+
+    def _update_gforce_frame(self, data):
+        """Cargar un paquete en la gráfica de G-force.
+
+        El eje X es fijo (ver ``create_graphs_row``); sólo cambian los valores.
+        """
+        self.gforce_data = data['gforce_data']
+        self._fit_ylim(self.gforce_graph, self.gforce_data)
+        self._draw_trace(self.gforce_graph, self.gforce_data)
+
     def create_camera_panel(self, parent):
         """Crear panel de cámaras duales"""
-        card = tk.Frame(parent, bg=self.bg_panel)
+        card = tk.Frame(parent, **PANEL_STYLE)
         
         # Encabezado
-        header = tk.Frame(card, bg=self.bg_panel)
+        header = tk.Frame(card, **PANEL_STYLE)
         header.pack(fill=tk.X, padx=20, pady=(15, 10))
         
-        title_frame = tk.Frame(header, bg=self.bg_panel)
+        title_frame = tk.Frame(header, **PANEL_STYLE)
         title_frame.pack(side=tk.LEFT)
         
-        icon = tk.Label(title_frame, text="📹", font=('Arial', 14), bg=self.bg_panel)
+        icon = tk.Label(title_frame, text="📹", font=('Arial', 14), **PANEL_STYLE)
         icon.pack(side=tk.LEFT)
         
         title = tk.Label(title_frame, text="DUAL PAYLOAD OPTICS - STEREOSCOPIC DOWNLINK", 
-                        font=('Arial', 11, 'bold'), bg=self.bg_panel, fg=self.text_white)
+                        font=('Arial', 11, 'bold'), **PANEL_TEXT_STYLE)
         title.pack(side=tk.LEFT, padx=(8, 0))
         
         # Info de resolución
         info = tk.Label(header, text="RES: 2x 1080p @ 60FPS  ●", 
-                       font=('Arial', 9), bg=self.bg_panel, fg=self.text_gray)
+                       font=('Arial', 9), **PANEL_MUTED_STYLE)
         info.pack(side=tk.RIGHT)
         
         # Contenedor de cámaras
-        cam_container = tk.Frame(card, bg=self.bg_panel)
+        cam_container = tk.Frame(card, **PANEL_STYLE)
         cam_container.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
         
         # Cámara izquierda - CLICKEABLE
@@ -540,15 +651,15 @@ class CanSatMissionControl:
         cam_window = tk.Toplevel(self.root)
         cam_window.title(f"CAM_01_{camera_name} - Vista Ampliada")
         cam_window.geometry("800x600")
-        cam_window.configure(bg=self.bg_dark)
+        cam_window.configure(**DARK_STYLE)
         
         # Encabezado
-        header = tk.Frame(cam_window, bg=self.bg_panel, height=60)
+        header = tk.Frame(cam_window, bg=THEME['bg_panel'], height=60)
         header.pack(fill=tk.X)
         header.pack_propagate(False)
         
         title = tk.Label(header, text=f"📹  CAM_01_{camera_name}  |  VISTA AMPLIADA", 
-                        font=('Arial', 16, 'bold'), bg=self.bg_panel, fg=self.text_white)
+                        font=('Arial', 16, 'bold'), **PANEL_TEXT_STYLE)
         title.pack(pady=15)
         
         # Área de video
@@ -562,7 +673,7 @@ class CanSatMissionControl:
         
         # Botón cerrar
         close_btn = tk.Button(cam_window, text="✕ CERRAR", font=('Arial', 11, 'bold'),
-                             bg='#ff4444', fg=self.text_white, relief=tk.FLAT,
+                             bg='#ff4444', fg=THEME['text_white'], relief=tk.FLAT,
                              padx=20, pady=10, cursor='hand2',
                              command=cam_window.destroy)
         close_btn.pack(pady=(0, 20))
@@ -570,48 +681,59 @@ class CanSatMissionControl:
     def create_log_panel(self, parent):
         """Crear panel de log de paquetes y controles"""
         # Panel de log
-        log_card = tk.Frame(parent, bg=self.bg_panel, height=450)
+        log_card = tk.Frame(parent, bg=THEME['bg_panel'], height=450)
         log_card.pack(fill=tk.BOTH, expand=True, pady=(0, 15))
         
         # Encabezado del log
-        log_header = tk.Frame(log_card, bg=self.bg_panel)
+        log_header = tk.Frame(log_card, **PANEL_STYLE)
         log_header.pack(fill=tk.X, padx=15, pady=(15, 10))
         
-        log_icon = tk.Label(log_header, text="📋", font=('Arial', 12), bg=self.bg_panel)
+        log_icon = tk.Label(log_header, text="📋", font=('Arial', 12), **PANEL_STYLE)
         log_icon.pack(side=tk.LEFT)
         
         log_title = tk.Label(log_header, text="LIVE PACKET LOG", 
                             font=('Arial', 11, 'bold'), 
-                            bg=self.bg_panel, fg=self.text_white)
+                            **PANEL_TEXT_STYLE)
         log_title.pack(side=tk.LEFT, padx=(8, 0))
         
         menu_icon = tk.Label(log_header, text="☰", font=('Arial', 14), 
-                            bg=self.bg_panel, fg=self.text_gray)
+                            **PANEL_MUTED_STYLE)
         menu_icon.pack(side=tk.RIGHT)
         
-        # Área de texto del log
-        log_frame = tk.Frame(log_card, bg='#1e2a3a')
+        # Área del log (alto fijo: el contenido no debe empujar a los paneles
+        # de abajo)
+        log_frame = tk.Frame(log_card, bg='#1e2a3a', height=370, pady=10)
         log_frame.pack(fill=tk.BOTH, expand=True, padx=15, pady=(0, 15))
+        log_frame.pack_propagate(False)
         
         # Aquí se muestran los MENSAJES DEL LOG en tiempo real
         # Formato: [TIMESTAMP] TIPO Mensaje
-        self.log_text = tk.Text(log_frame, bg='#1e2a3a', fg=self.text_gray,
-                               font=('Consolas', 9), relief=tk.FLAT,
-                               wrap=tk.WORD, padx=10, pady=10)
-        self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
-        
-        # Scrollbar
-        scrollbar = tk.Scrollbar(log_frame, command=self.log_text.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.log_text.config(yscrollcommand=scrollbar.set)
-        
-        # Tags para colorear diferentes tipos de mensajes
-        self.log_text.tag_config('INFO', foreground=self.blue_accent)
-        self.log_text.tag_config('STAT', foreground=self.green_accent)
-        self.log_text.tag_config('WARN', foreground='#ffaa00')
-        self.log_text.tag_config('DATA', foreground=self.text_gray)
-        self.log_text.tag_config('RECV', foreground='#9b59b6')
-        self.log_text.tag_config('timestamp', foreground='#5a6a7a')
+        # Filas preasignadas que se reutilizan en anillo: cada mensaje
+        # sobrescribe la fila más antigua y la mueve al fondo. Se empaquetan
+        # desde abajo, así que si no caben todas se recortan las más viejas.
+        self.log_rows = [tk.Label(log_frame, bg='#1e2a3a', fg=THEME['text_gray'],
+                                  font=('Consolas', 9), anchor='w',
+                                  justify=tk.LEFT, wraplength=290)
+                         for _ in range(LOG_ROWS)]
+        for row in reversed(self.log_rows):
+            row.pack(side=tk.BOTTOM, fill=tk.X, padx=10)
+        self.log_head = 0
+        # Historial en memoria (acotado), incluidos los mensajes que ya no
+        # tienen fila visible
+        self.log_history = deque(maxlen=LOG_HISTORY)
+        # Última hora formateada y el segundo al que corresponde: los
+        # mensajes del mismo segundo reutilizan el texto
+        self._log_ts_second = -1
+        self._log_ts_text = ""
+        
+        # Colores para los diferentes tipos de mensajes
+        self.log_colors = {
+            'INFO': THEME['blue_accent'],
+            'STAT': THEME['green_accent'],
+            'WARN': '#ffaa00',
+            'DATA': THEME['text_gray'],
+            'RECV': '#9b59b6',
+        }
         
         # Agregar mensajes de ejemplo
         self.add_log_message("INFO", "Packet #14205 received (24 bytes)")
@@ -625,91 +747,101 @@ class CanSatMissionControl:
         
         # Input de comandos
         # Aquí se ingresan COMANDOS MANUALES para enviar al CanSat
-        cmd_frame = tk.Frame(parent, bg=self.bg_panel, height=60)
+        cmd_frame = tk.Frame(parent, bg=THEME['bg_panel'], height=60)
         cmd_frame.pack(fill=tk.X, pady=(0, 15))
         cmd_frame.pack_propagate(False)
         
         cmd_inner = tk.Frame(cmd_frame, bg='#1e2a3a')
         cmd_inner.pack(fill=tk.BOTH, expand=True, padx=15, pady=12)
         
-        self.cmd_entry = tk.Entry(cmd_inner, bg='#1e2a3a', fg=self.text_gray,
+        self.cmd_entry = tk.Entry(cmd_inner, bg='#1e2a3a', fg=THEME['text_gray'],
                                  font=('Consolas', 10), relief=tk.FLAT,
-                                 insertbackground=self.blue_accent)
+                                 insertbackground=THEME['blue_accent'])
         self.cmd_entry.insert(0, "Send Command...")
         self.cmd_entry.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 10))
         
         send_btn = tk.Button(cmd_inner, text="➤", font=('Arial', 14, 'bold'),
-                            bg=self.blue_accent, fg=self.text_white,
+                            bg=THEME['blue_accent'], fg=THEME['text_white'],
                             relief=tk.FLAT, width=3, cursor='hand2',
                             command=self.send_command)
         send_btn.pack(side=tk.RIGHT, padx=(0, 10))
         
         # Panel de fase de misión
-        phase_card = tk.Frame(parent, bg=self.bg_panel)
+        phase_card = tk.Frame(parent, **PANEL_STYLE)
         phase_card.pack(fill=tk.BOTH, expand=True)
         
-        phase_header = tk.Frame(phase_card, bg=self.bg_panel)
+        phase_header = tk.Frame(phase_card, **PANEL_STYLE)
         phase_header.pack(fill=tk.X, padx=15, pady=(15, 10))
         
-        phase_icon = tk.Label(phase_header, text="🚀", font=('Arial', 12), bg=self.bg_panel)
+        phase_icon = tk.Label(phase_header, text="🚀", font=('Arial', 12), **PANEL_STYLE)
         phase_icon.pack(side=tk.LEFT)
         
         phase_title = tk.Label(phase_header, text="MISSION PHASE", 
                               font=('Arial', 11, 'bold'), 
-                              bg=self.bg_panel, fg=self.text_white)
+                              **PANEL_TEXT_STYLE)
         phase_title.pack(side=tk.LEFT, padx=(8, 0))
         
         # Lista de fases
         # Aquí se muestra el ESTADO DE CADA FASE de la misión
-        phases_frame = tk.Frame(phase_card, bg=self.bg_panel)
+        phases_frame = tk.Frame(phase_card, **PANEL_STYLE)
         phases_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 15))
         
         phases = [
-            ("✓", "Pre-Flight Checklist", self.green_accent, True),
-            ("✓", "Ascent Phase", self.green_accent, True),
-            ("⟳", "Science Deployment", self.blue_accent, False),
-            ("○", "Recovery Sequence", self.text_gray, False)
+            ("✓", "Pre-Flight Checklist", THEME['green_accent'], True),
+            ("✓", "Ascent Phase", THEME['green_accent'], True),
+            ("⟳", "Science Deployment", THEME['blue_accent'], False),
+            ("○", "Recovery Sequence", THEME['text_gray'], False)
         ]
         
         for icon, text, color, completed in phases:
-            phase_item = tk.Frame(phases_frame, bg=self.bg_panel)
+            phase_item = tk.Frame(phases_frame, **PANEL_STYLE)
             phase_item.pack(fill=tk.X, pady=5)
             
             icon_label = tk.Label(phase_item, text=icon, font=('Arial', 12),
-                                 bg=self.bg_panel, fg=color, width=2)
+                                 bg=THEME['bg_panel'], fg=color, width=2)
             icon_label.pack(side=tk.LEFT)
             
             text_label = tk.Label(phase_item, text=text, font=('Arial', 10),
-                                 bg=self.bg_panel, 
-                                 fg=self.text_white if completed else self.text_gray,
+                                 **(PANEL_TEXT_STYLE if completed else PANEL_MUTED_STYLE),
                                  anchor='w')
             text_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(8, 0))
             
     def create_footer(self):
         """Crear barra inferior"""
-        footer = tk.Frame(self.root, bg=self.bg_dark, height=35)
-        footer.pack(fill=tk.X, padx=20, pady=(0, 10))
+        footer = tk.Frame(self.root, bg=THEME['bg_dark'], height=35)
+        # anclado abajo: se empaqueta antes que el contenido principal
+        footer.pack(side=tk.BOTTOM, fill=tk.X, padx=20, pady=(0, 10))
         footer.pack_propagate(False)
         
         sys_label = tk.Label(footer, text="SYS_OK", font=('Arial', 9, 'bold'),
-                            bg=self.bg_dark, fg=self.green_accent)
+                            bg=THEME['bg_dark'], fg=THEME['green_accent'])
         sys_label.pack(side=tk.LEFT)
         
         build_label = tk.Label(footer, text="BUILD: v2.4.12-ALPHA",
-                              font=('Arial', 9), bg=self.bg_dark, fg=self.text_gray)
+                              font=('Arial', 9), bg=THEME['bg_dark'], fg=THEME['text_gray'])
         build_label.pack(side=tk.LEFT, padx=(15, 0))
         
         copy_label = tk.Label(footer, text="CANSAT INTERNATIONAL 2024",
-                             font=('Arial', 9), bg=self.bg_dark, fg=self.text_gray)
+                             font=('Arial', 9), bg=THEME['bg_dark'], fg=THEME['text_gray'])
         copy_label.pack(side=tk.RIGHT)
         
     def add_log_message(self, msg_type, message):
-        """Agregar mensaje al log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{timestamp}] ", 'timestamp')
-        self.log_text.insert(tk.END, f"{msg_type} ", msg_type)
-        self.log_text.insert(tk.END, f"{message}\n")
-        self.log_text.see(tk.END)
+        """Agregar mensaje al log.
+
+        Reutiliza la fila más antigua: se cambia su texto y color y se
+        empaqueta justo debajo del mensaje anterior.
+        """
+        second = int(time.time())
+        if second != self._log_ts_second:
+            self._log_ts_second = second
+            self._log_ts_text = time.strftime("%H:%M:%S", time.localtime(second))
+        line = f"[{self._log_ts_text}] {msg_type} {message}"
+        self.log_history.append(line)
+        
+        row = self.log_rows[self.log_head]
+        row.configure(text=line, fg=self.log_colors.get(msg_type, THEME['text_gray']))
+        row.pack_configure(before=self.log_rows[self.log_head - 1])
+        self.log_head = (self.log_head + 1) % LOG_ROWS
         
     def send_command(self):
         """Enviar comando (aquí se procesaría el COMANDO ingresado)"""
@@ -726,32 +858,70 @@ class CanSatMissionControl:
             self.mission_running = True
             self.mission_start_time = datetime.now()
             self.elapsed_seconds = 0
+            self._timer_seconds = -1
             self.start_btn.config(text="⏸ STOP", bg='#ff4444')
             
-            # Iniciar simulación y actualizaciones
+            # Iniciar simulación y actualizaciones (timer incluido)
             self.simulator.reset()
-            self.update_mission_timer()
+            self._sample_q.clear()
+            self._plot_skip = 0
+            # el simulador vuelve a cero: las gráficas también, con su escala
+            # inicial
+            self._reset_graph(self.velocity_graph)
+            self._reset_graph(self.gforce_graph)
+            self._sampler_stop = threading.Event()
+            self._sampler_thread = threading.Thread(target=self._sampler_loop,
+                                                    args=(self._sampler_stop,),
+                                                    daemon=True)
+            self._sampler_thread.start()
+            self._next_tick = time.monotonic()
             self.update_telemetry()
             
             self.add_log_message("INFO", "Mission START - All systems nominal")
         else:
             # Detener misión
             self.mission_running = False
-            self.start_btn.config(text="▶ START", bg=self.green_accent)
+            # cancelar el tick pendiente para que un START rápido no deje dos
+            # bucles en marcha
+            if self._tick_id is not None:
+                self.root.after_cancel(self._tick_id)
+                self._tick_id = None
+            # detener el productor antes de que un nuevo START reinicie el
+            # simulador que está usando
+            self._sampler_stop.set()
+            self._sampler_thread.join()
+            self.start_btn.config(text="▶ START", bg=THEME['green_accent'])
             self.add_log_message("INFO", "Mission PAUSED by operator")
             
-    def update_mission_timer(self):
-        """Actualizar timer de misión en tiempo real"""
-        if self.mission_running:
-            elapsed = datetime.now() - self.mission_start_time
-            self.elapsed_seconds = int(elapsed.total_seconds())
-            
-            hours = self.elapsed_seconds // 3600
-            minutes = (self.elapsed_seconds % 3600) // 60
-            seconds = self.elapsed_seconds % 60
+    def _sampler_loop(self, stop):
+        """Hilo productor: generar un paquete cada ``SAMPLE_PERIOD`` segundos.
+
+        Los históricos se copian: el simulador los sigue escribiendo.
+        """
+        # compilar los núcleos (si hay numba) aquí y no en el hilo de Tk
+        warm_up()
+        while not stop.wait(SAMPLE_PERIOD):
+            data = self.simulator.get_next(SAMPLE_PERIOD)
+            data['history'] = data['history'].copy()
+            data['velocity_data'], data['gforce_data'] = data['history']
+            self._sample_q.append(data)
             
-            self.timer_display.config(text=f"T+ {hours:02d}:{minutes:02d}:{seconds:02d}")
-            self.root.after(1000, self.update_mission_timer)
+    def update_mission_timer(self):
+        """Actualizar timer de misión en tiempo real.
+
+        Lo llama ``update_telemetry`` en cada paquete; la etiqueta sólo se
+        toca cuando cambia el segundo.
+        """
+        elapsed = int((datetime.now() - self.mission_start_time).total_seconds())
+        if elapsed == self._timer_seconds:
+            return
+        self._timer_seconds = elapsed
+        
+        hours = elapsed // 3600
+        minutes = (elapsed % 3600) // 60
+        seconds = elapsed % 60
+        
+        self.timer_display['text'] = f"T+ {hours:02d}:{minutes:02d}:{seconds:02d}"
     
     def update_sensor_data(self):
         """Compatibilidad: actualiza sensores llamando al bucle unificado."""
@@ -766,95 +936,95 @@ class CanSatMissionControl:
     def update_telemetry(self):
         """Actualizar todos los valores (sensores + gráficas) usando el simulador.
 
-        Este método reemplaza los dos bucles anteriores y recibe los datos de
-        ``telemetry_simulator.TelemetrySimulator`` como si se tratara de paquetes
-        entrantes. El bucle se reprograma con ``after`` para simular la llegada
-        continua de telemetría.
+        Es el único bucle periódico de la interfaz. Los paquetes de
+        ``telemetry_simulator.TelemetrySimulator`` llegan desde el hilo
+        productor como si fueran telemetría entrante; en cada tick se
+        actualiza el timer y, si llegó algo, se aplica sólo el paquete más
+        reciente (los atrasados se descartan). Se reprograma con ``after``
+        hacia el siguiente múltiplo de ``TICK_MS`` desde el arranque.
         """
         if self.mission_running:
-            # obtener un nuevo paquete simulado
-            data = self.simulator.get_next()
-            self.elapsed_seconds = self.simulator.elapsed_seconds
-
-            # SENSORES ------------------------------------------------------
-            new_pressure = data['pressure']
-            self.pressure_value.set(new_pressure)
-            if self.pressure_label:
-                self.pressure_label.config(text=f"{new_pressure:.1f}")
-            if hasattr(self, 'pressure_canvas'):
-                fill = (new_pressure - 95) / 15
-                fill = max(0, min(1, fill))
-                self.pressure_canvas.delete('progress_arc')
-                extent = 359.9 * fill
-                self.pressure_canvas.create_arc(10, 10, 110, 110, start=90, extent=-extent,
-                                               outline=self.pressure_color, width=12,
-                                               style=tk.ARC, tags='progress_arc')
-
-            new_temp = data['temperature']
-            self.temperature_value.set(new_temp)
-            if self.temp_label:
-                self.temp_label.config(text=f"{new_temp:.1f}")
-            if hasattr(self, 'temp_canvas'):
-                fill = (new_temp - 15) / 25
-                fill = max(0, min(1, fill))
-                self.temp_canvas.delete('progress_arc')
-                extent = 359.9 * fill
-                self.temp_canvas.create_arc(10, 10, 110, 110, start=90, extent=-extent,
-                                            outline=self.temp_color, width=12,
-                                            style=tk.ARC, tags='progress_arc')
-
-            new_altitude = data['altitude']
-            self.altitude_value.set(new_altitude)
-            if self.altitude_label:
-                self.altitude_label.config(text=f"{new_altitude:,.1f}")
-
-            new_rate = data['altitude_rate']
-            self.altitude_rate.set(new_rate)
-            if self.altitude_rate_label:
-                sign = "+" if new_rate >= 0 else ""
-                color = self.green_accent if new_rate >= 0 else '#ff6b6b'
-                self.altitude_rate_label.config(text=f"{sign}{new_rate:.1f} m/s", fg=color)
-
-            new_latency = data['latency']
-            self.signal_latency.set(new_latency)
-            if self.latency_label:
-                self.latency_label.config(text=f"{int(new_latency)}")
-
-            # GRÁFICAS ------------------------------------------------------
-            self.velocity_time = data['velocity_time']
-            self.velocity_data = data['velocity_data']
-            self.velocity_line.set_data(self.velocity_time, self.velocity_data)
-            # ArtistList returned by ``ax.collections`` no tiene ``clear`` en algunas
-            # versiones de matplotlib, así que eliminamos manualmente cada colección.
-            for col in list(self.velocity_ax.collections):
-                col.remove()
-            self.velocity_ax.fill_between(self.velocity_time, self.velocity_data,
-                                          alpha=0.1, color=self.blue_accent)
-            self.velocity_canvas.draw()
-
-            self.gforce_time = data['gforce_time']
-            self.gforce_data = data['gforce_data']
-            self.gforce_line.set_data(self.gforce_time, self.gforce_data)
-            for col in list(self.gforce_ax.collections):
-                col.remove()
-            self.gforce_ax.fill_between(self.gforce_time, self.gforce_data,
-                                        alpha=0.15, color=self.orange_accent)
-            x_min = self.gforce_time[0]
-            x_max = self.gforce_time[-1]
-            self.gforce_ax.set_xlim(x_min, x_max)
-            self.gforce_canvas.draw()
-
-            # Log de telemetría
-            if self.elapsed_seconds % 3 == 0:
+            self.update_mission_timer()
+
+            data = None
+            while self._sample_q:
+                data = self._sample_q.popleft()
+            if data is not None:
+                self.apply_packet(data)
+
+            # reprogramar contra un plazo absoluto: un tick tardío acorta la
+            # espera del siguiente y, si se perdieron ticks enteros, se saltan
+            # (manteniendo la fase) en lugar de encadenarlos
+            period = TICK_MS / 1000
+            self._next_tick += period
+            now = time.monotonic()
+            if self._next_tick < now:
+                self._next_tick += math.ceil((now - self._next_tick) / period) * period
+            delay_ms = int((self._next_tick - now) * 1000)
+            self._tick_id = self.root.after(delay_ms, self.update_telemetry)
+
+    def apply_packet(self, data):
+        """Aplicar un paquete de telemetría a etiquetas, medidores y gráficas.
+
+        Todo se reduce a cambiar textos y coordenadas de widgets ya creados;
+        Tk los repinta cuando queda ocioso.
+        """
+        self.elapsed_seconds = data['elapsed_seconds']
+
+        # SENSORES ------------------------------------------------------
+        # La misión sólo arranca cuando la interfaz está completa (START está
+        # deshabilitado hasta entonces), así que todos los widgets existen.
+        new_pressure = data['pressure']
+        self.pressure = new_pressure
+        self.pressure_canvas.itemconfigure(self.pressure_value_id,
+                                           text=self._fmt1(new_pressure))
+        self._set_gauge_fill('pressure', self.pressure_canvas, self.pressure_arc_id,
+                             (new_pressure - 95) / 15)
+
+        new_temp = data['temperature']
+        self.temperature = new_temp
+        self.temp_canvas.itemconfigure(self.temp_value_id, text=self._fmt1(new_temp))
+        self._set_gauge_fill('temperature', self.temp_canvas, self.temp_arc_id,
+                             (new_temp - 15) / 25)
+
+        new_altitude = data['altitude']
+        self.altitude = new_altitude
+        self.altitude_label['text'] = self._fmt_altitude(new_altitude)
+
+        new_rate = data['altitude_rate']
+        self.altitude_rate = new_rate
+        # el color sólo se reconfigura cuando cambia el signo
+        rising = new_rate >= 0
+        if rising == self._rate_rising:
+            self.altitude_rate_label['text'] = self._fmt_rate(new_rate)
+        else:
+            self._rate_rising = rising
+            color = THEME['green_accent'] if rising else '#ff6b6b'
+            self.altitude_rate_label.config(text=self._fmt_rate(new_rate), fg=color)
+
+        new_latency = data['latency']
+        self.signal_latency = new_latency
+        self.latency_label['text'] = self._fmt0(new_latency)
+
+        # GRÁFICAS ------------------------------------------------------
+        # Sólo uno de cada PLOT_EVERY paquetes llega a las gráficas; los
+        # demás actualizan sólo los valores numéricos.
+        if self._plot_skip == 0:
+            self._update_velocity_frame(data)
+            self._update_gforce_frame(data)
+        self._plot_skip = (self._plot_skip + 1) % PLOT_EVERY
+
+        # Log de telemetría: los paquetes de medio segundo nunca registran
+        # nada, así que se descartan con una sola comprobación
+        if self.elapsed_seconds % 1 == 0:
+            second = int(self.elapsed_seconds)
+            if second % 3 == 0:
                 self.add_log_message("DATA",
                     f"VEL:{data['new_velocity']:.1f}m/s G:{data['new_gforce']:.2f}")
-            if self.elapsed_seconds % 5 == 0:
+            if second % 5 == 0:
                 self.add_log_message("STAT",
                     f"P:{new_pressure:.2f} T:{new_temp:.2f} A:{new_altitude:.2f}")
 
-            # reprogramar llamada
-            self.root.after(500, self.update_telemetry)
-
 
 # Ejecutar aplicación
 if __name__ == "__main__":
@@ -0,0 +1,66 @@
+"""Núcleos numéricos que se ejecutan en cada paquete de telemetría.
+
+Se compilan con ``numba.njit`` cuando numba está instalado; si no, las mismas
+funciones corren como Python normal. Así el simulador no depende de numba,
+pero lo aprovecha si está disponible.
+"""
+
+import math
+import random
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba es opcional
+    def njit(*args, **kwargs):
+        """Sustituto de ``numba.njit``: devuelve la función sin compilar."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def push_history(history, head, new_velocity, new_gforce):
+    """Escribir una muestra de velocidad y de g-force y devolver la nueva cabeza.
+
+    ``history`` tiene una fila por canal (velocidad, g-force) y es circular
+    con el doble de la ventana: cada muestra se escribe en ``head`` y en
+    ``head + n`` para que ``history[:, head:head + n]`` sea siempre una vista
+    ordenada (ver ``telemetry_simulator``).
+    """
+    n = history.shape[1] // 2
+    history[0, head] = new_velocity
+    history[0, head + n] = new_velocity
+    history[1, head] = new_gforce
+    history[1, head + n] = new_gforce
+    return (head + 1) % n
+
+
+@njit(cache=True, fastmath=True)
+def step_telemetry(t, history, head):
+    """Calcular los sensores del instante ``t`` y guardar su muestra histórica.
+
+    Es todo el cálculo numérico de un paquete: devuelve presión,
+    temperatura, altitud, tasa de altitud, latencia, velocidad, g-force y
+    la nueva cabeza de ``history`` (ver ``push_history``). Con numba, el
+    ruido sale de su propio generador, independiente del de ``random``.
+    """
+    pressure = 101.3 + math.sin(t / 10) * 2 + random.gauss(0, 0.1)
+    temperature = 24.8 + math.sin(t / 15 + 1) * 3 + random.gauss(0, 0.2)
+    altitude = 1245.8 + t * 2.5 + math.sin(t / 8) * 50
+    altitude_rate = 12.4 + math.sin(t / 7) * 8
+    latency = max(10.0, min(100.0, 24 + random.gauss(0, 3)))
+
+    new_velocity = max(0.0, 15 + 10 * math.sin(t / 20) + random.gauss(0, 1))
+    new_gforce = max(0.0, 2 + 3 * math.exp(-((t % 30 - 15) ** 2) / 50)
+                     + random.gauss(0, 0.3))
+
+    head = push_history(history, head, new_velocity, new_gforce)
+    return (pressure, temperature, altitude, altitude_rate, latency,
+            new_velocity, new_gforce, head)
+
+
+def warm_up():
+    """Forzar la compilación de los núcleos antes del primer paquete."""
+    step_telemetry(0.0, np.zeros((2, 2), dtype=np.float32), 0)
@@ -11,70 +11,66 @@ simulación no viva directamente en la interfaz gráfica.
 """
 
 import numpy as np
-import random
 
-class TelemetrySimulator:
-    def __init__(self):
-        # contador de segundos simulados (float para pasos fraccionarios)
-        self.elapsed_seconds = 0.0
+from telemetry_kernels import step_telemetry
+
+# muestras que conserva cada histórico de las gráficas
+HISTORY_LEN = 100
 
-        # vectores históricos que se usan en las gráficas
-        self.velocity_time = np.linspace(-120, 0, 100)
-        self.velocity_data = np.zeros_like(self.velocity_time)
 
-        self.gforce_time = np.linspace(-1.5, 4.0, 100)
-        self.gforce_data = np.zeros_like(self.gforce_time)
+class TelemetrySimulator:
+    def __init__(self):
+        self.reset()
 
     def reset(self):
         """Reiniciar simulación a valores iniciales."""
+        # contador de segundos simulados (float para pasos fraccionarios)
         self.elapsed_seconds = 0.0
-        self.velocity_time = np.linspace(-120, 0, 100)
-        self.velocity_data = np.zeros_like(self.velocity_time)
-        self.gforce_time = np.linspace(-1.5, 4.0, 100)
-        self.gforce_data = np.zeros_like(self.gforce_time)
+
+        # vectores históricos que se usan en las gráficas. Los datos viven en
+        # un único búfer con una fila por canal (velocidad, g-force), circular
+        # y del doble de la ventana: cada muestra se escribe dos veces, así
+        # ``_history[:, head:head + HISTORY_LEN]`` es siempre una vista
+        # ordenada y ``*_data`` no necesita copias ni desplazamientos.
+        # float32 basta para telemetría que se muestra con un decimal.
+        self._head = 0
+        self._history = np.zeros((2, 2 * HISTORY_LEN), dtype=np.float32)
+        self.history = self._history[:, :HISTORY_LEN]
+        self.velocity_data = self.history[0]
+        self.gforce_data = self.history[1]
 
     def get_next(self, dt: float = 0.5) -> dict:
         """Avanzar la simulación ``dt`` segundos y retornar un paquete de datos.
 
         Los campos devueltos son los que necesita la interfaz para actualizar
-        sensores y gráficas.
+        sensores y gráficas. ``history`` reúne velocidad y g-force en un
+        arreglo ``(2, HISTORY_LEN)``; ``velocity_data`` y ``gforce_data`` son
+        sus filas. Los históricos se entregan como vistas de los búferes
+        internos, sin copiar: siguen siendo válidos sólo hasta la siguiente
+        llamada.
         """
         self.elapsed_seconds += dt
 
-        # sensores
-        pressure = 101.3 + np.sin(self.elapsed_seconds / 10) * 2 + np.random.normal(0, 0.1)
-        temperature = 24.8 + np.sin(self.elapsed_seconds / 15 + 1) * 3 + np.random.normal(0, 0.2)
-        altitude = 1245.8 + self.elapsed_seconds * 2.5 + np.sin(self.elapsed_seconds / 8) * 50
-        altitude_rate = 12.4 + np.sin(self.elapsed_seconds / 7) * 8
-        latency = 24 + np.random.normal(0, 3)
-        latency = max(10, min(100, latency))
-
-        # velocidad
-        # no rotamos el eje temporal: permanecerá constante para evitar que los
-        # valores se "borren" al desplazar ceros repetidos.
-        new_velocity = 15 + 10 * np.sin(self.elapsed_seconds / 20) + np.random.normal(0, 1)
-        new_velocity = max(0, new_velocity)
-        self.velocity_data = np.roll(self.velocity_data, -1)
-        self.velocity_data[-1] = new_velocity
+        # sensores y nueva muestra de los históricos (velocidad, g-force):
+        # todo el cálculo numérico va en un solo núcleo
+        (pressure, temperature, altitude, altitude_rate, latency,
+         new_velocity, new_gforce, self._head) = step_telemetry(
+            self.elapsed_seconds, self._history, self._head)
 
-        # g-force
-        self.gforce_time = np.roll(self.gforce_time, -1)
-        self.gforce_time[-1] = self.gforce_time[-2] + 0.055
-        new_gforce = 2 + 3 * np.exp(-((self.elapsed_seconds % 30 - 15)**2) / 50) + np.random.normal(0, 0.3)
-        new_gforce = max(0, new_gforce)
-        self.gforce_data = np.roll(self.gforce_data, -1)
-        self.gforce_data[-1] = new_gforce
+        head = self._head
+        self.history = self._history[:, head:head + HISTORY_LEN]
+        self.velocity_data, self.gforce_data = self.history
 
         return {
+            'elapsed_seconds': self.elapsed_seconds,
             'pressure': pressure,
             'temperature': temperature,
             'altitude': altitude,
             'altitude_rate': altitude_rate,
             'latency': latency,
-            'velocity_time': self.velocity_time.copy(),
-            'velocity_data': self.velocity_data.copy(),
-            'gforce_time': self.gforce_time.copy(),
-            'gforce_data': self.gforce_data.copy(),
+            'history': self.history,
+            'velocity_data': self.velocity_data,
+            'gforce_data': self.gforce_data,
             'new_velocity': new_velocity,
             'new_gforce': new_gforce,
         }